@@ -1,11 +1,20 @@
 import os
-import feedparser
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+from lxml import etree
 import google.generativeai as genai
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
-from datetime import datetime
+from datetime import datetime, timedelta
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import codecs
+from collections import deque
+import hashlib
+import json
+import shelve
+import threading
 import time
 import re
 
@@ -18,8 +27,35 @@ FEEDS = {
 }
 # 取得する記事の数
 MAX_ENTRIES_PER_FEED = 3
+# フィードの名前空間（RSS 2.0 は名前空間なし）
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
 # 要約の最大文字数
 MAX_SUMMARY_LENGTH = 300 # Geminiへの指示で調整
+# Geminiに送る記事1件あたりの最大トークン数
+MAX_ARTICLE_TOKENS = 4000
+# 1回のGeminiリクエストでまとめて要約する記事の数
+SUMMARY_BATCH_SIZE = 5
+# まとめて送る記事同士の区切り
+ARTICLE_DELIMITER = "\n---ARTICLE---\n"
+# 要約の指示（毎回同じ内容なので system_instruction として渡し、contentには記事の本文だけを送る）
+SUMMARY_INSTRUCTION = (
+    f"以下の複数のニュース記事を、それぞれ日本語で{MAX_SUMMARY_LENGTH}字程度の箇条書きで要約してください。"
+    "各記事の重要なポイントを3つに絞ってください。"
+    f"記事は「{ARTICLE_DELIMITER.strip()}」で区切られ、先頭に[番号]が付いています。"
+    "要約は記事の番号順に、記事と同じ数の文字列からなるJSON配列で返してください。"
+)
+# Gemini APIの1分あたりの最大リクエスト数（無料利用枠）
+GEMINI_RPM = 2
+# 429エラーのメッセージから待機秒数（retry_delay）を抽出するパターン
+_RETRY_RE = re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)\s*\}")
+# フィード・記事取得の並列数
+MAX_WORKERS = 8
+# 記事ページから読み込む最大バイト数（巨大なページでメモリを使いすぎないようにする）
+MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+# 記事本文と要約のキャッシュ（再実行時に同じ記事を取得・要約し直さない）
+CACHE_PATH = os.path.join(".cache", "news.db")
+CACHE_TTL = timedelta(days=3)
 
 # --- APIキーとメールアドレスを環境変数から取得 ---
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -27,51 +63,309 @@ SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
 TO_EMAIL = os.getenv("TO_EMAIL_ADDRESS")
 FROM_EMAIL = os.getenv("FROM_EMAIL_ADDRESS")
 
-def get_article_text(url):
-    """URLから記事の本文を抽出する"""
+# --- HTTPセッション ---
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'
+# brotliは対応していないホストで誤った応答になることがあるため、gzip/deflateのみ受け付ける
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# 一時的なサーバーエラーとして再試行するステータスコードと回数
+RETRY_STATUS_CODES = (502, 503, 504)
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5  # 秒
+
+# フィード・記事の取得で共有するクライアント。
+# 接続を使い回し、HTTP/2で同じホストへの複数リクエストを1本のTLS接続に多重化する
+HTTP_CLIENT = httpx.Client(
+    headers={'User-Agent': USER_AGENT, 'Accept-Encoding': ACCEPT_ENCODING},
+    transport=httpx.HTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+        retries=HTTP_RETRIES, # 接続エラーの再試行
+    ),
+    timeout=10,
+    follow_redirects=True,
+)
+
+@contextmanager
+def http_get_stream(url):
+    """URLにGETリクエストを送り、ストリーミングでレスポンスを開く
+
+    502/503/504は指数バックオフで再試行し、最終的なエラーステータスは例外にする。
+    """
+    request = HTTP_CLIENT.build_request("GET", url)
+    for i in range(HTTP_RETRIES + 1):
+        response = HTTP_CLIENT.send(request, stream=True)
+        if response.status_code not in RETRY_STATUS_CODES or i == HTTP_RETRIES:
+            break
+        response.close()
+        time.sleep(HTTP_BACKOFF_FACTOR * (2 ** i))
+
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3'}
-        response = requests.get(url, headers=headers, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, "lxml")
-        
+        yield response
+    finally:
+        response.close()
+
+# --- Geminiモデル ---
+# 設定とモデルの生成は起動時に一度だけ行い、全記事で使い回す
+if GEMINI_API_KEY:
+    genai.configure(api_key=GEMINI_API_KEY)
+GEMINI_MODEL_NAME = 'gemini-2.5-flash' # 無料利用枠でより多くのリクエストを処理できる可能性があるモデルに変更
+MODEL = genai.GenerativeModel(GEMINI_MODEL_NAME, system_instruction=SUMMARY_INSTRUCTION)
+# トークン数の計算用。count_tokensはsystem_instructionも数えてしまうため、指示なしのモデルを使う
+TOKEN_COUNT_MODEL = genai.GenerativeModel(GEMINI_MODEL_NAME)
+
+class RateLimiter:
+    """直近1分間のリクエスト数がrpmを超えない分だけ待機するレートリミッター"""
+
+    def __init__(self, rpm):
+        self.rpm = rpm
+        self.timestamps = deque(maxlen=rpm)
+        self.blocked_until = 0.0
+
+    def wait(self):
+        """次のリクエストを送ってよくなるまで待機する"""
+        now = time.monotonic()
+        wait_time = self.blocked_until - now
+        if len(self.timestamps) == self.rpm:
+            wait_time = max(wait_time, self.timestamps[0] + 60 - now)
+        if wait_time > 0:
+            print(f"レート制限のため{wait_time:.1f}秒待機します...")
+            time.sleep(wait_time)
+        self.timestamps.append(time.monotonic())
+
+    def defer(self, seconds):
+        """429エラーで指示された秒数、次のリクエストを止める"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+GEMINI_RATE_LIMITER = RateLimiter(GEMINI_RPM)
+
+# --- キャッシュ ---
+# shelveはスレッドセーフではないため、アクセスはロックで直列化する
+_cache = None
+_cache_lock = threading.Lock()
+
+def _open_cache():
+    """キャッシュを開き、期限切れのエントリを削除する（ロック取得済みで呼ぶこと）"""
+    global _cache
+    if _cache is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        _cache = shelve.open(CACHE_PATH)
+        now = datetime.now()
+        for key in list(_cache.keys()):
+            if now - datetime.fromisoformat(_cache[key]["saved_at"]) >= CACHE_TTL:
+                del _cache[key]
+    return _cache
+
+def cache_key(kind, value):
+    """キャッシュの種類と値のSHA-256からキーを作る"""
+    return f"{kind}:{hashlib.sha256(value.encode('utf-8')).hexdigest()}"
+
+def body_digest(text):
+    """空白を正規化した本文のハッシュを返す（同じ本文の記事を見分けるために使う）"""
+    return hashlib.blake2b(" ".join(text.split()).encode("utf-8"), digest_size=16).digest()
+
+def cache_get(key):
+    """キャッシュから値を取得する。存在しないか期限切れならNoneを返す"""
+    try:
+        with _cache_lock:
+            entry = _open_cache().get(key)
+        if entry and datetime.now() - datetime.fromisoformat(entry["saved_at"]) < CACHE_TTL:
+            return entry["value"]
+    except Exception as e:
+        print(f"キャッシュ読み込みエラー: {e}")
+    return None
+
+def cache_set(key, value):
+    """値を保存時刻とともにキャッシュに書き込む"""
+    try:
+        with _cache_lock:
+            _open_cache()[key] = {"value": value, "saved_at": datetime.now().isoformat()}
+    except Exception as e:
+        print(f"キャッシュ書き込みエラー: {e}")
+
+def close_cache():
+    """キャッシュをディスクに書き出して閉じる"""
+    global _cache
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+def _atom_text(element):
+    """Atomのテキスト要素を type 属性（text/html/xhtml）に応じてプレーンテキストにする"""
+    content_type = element.get("type", "text")
+    if content_type == "xhtml":
+        # XHTMLは子要素（div）として埋め込まれているので、子孫のテキストをすべて集める
+        return "".join(element.itertext())
+    text = element.text or ""
+    if content_type == "html" and text.strip():
+        # HTMLはエスケープされた文字列なので、タグと文字参照を取り除く
+        return lxml.html.fragment_fromstring(text, create_parent="div").text_content()
+    return text
+
+def get_feed_entries(url):
+    """RSS/Atomフィードから先頭の記事のタイトルとリンクを取得する"""
+    try:
+        with http_get_stream(url) as response:
+            content = response.read()
+        parser = etree.XMLParser(resolve_entities=False, no_network=True, recover=True)
+        root = etree.fromstring(content, parser)
+        if root is None:
+            return []
+
+        entries = []
+        # RSS 2.0 / RSS 1.0 の item と Atom の entry を文書順にたどる
+        for item in root.iter("item", f"{RSS1_NS}item", f"{ATOM_NS}entry"):
+            # RSSのタイトルはプレーンテキスト、Atomのタイトルは type 属性に従って変換する
+            title = item.findtext("title") or item.findtext(f"{RSS1_NS}title")
+            if not title:
+                atom_title = item.find(f"{ATOM_NS}title")
+                title = _atom_text(atom_title) if atom_title is not None else ""
+            link = item.findtext("link") or item.findtext(f"{RSS1_NS}link")
+            if not link:
+                # Atomではlink要素のhref属性にURLがある（rel="alternate"を優先）
+                links = item.findall(f"{ATOM_NS}link")
+                alternates = [l for l in links if l.get("rel", "alternate") == "alternate"]
+                link = (alternates or links)[0].get("href") if links else None
+            if link:
+                entries.append((title.strip(), link.strip()))
+            if len(entries) >= MAX_ENTRIES_PER_FEED:
+                break
+        return entries
+    except httpx.HTTPError as e:
+        print(f"フィード取得エラー: {url}, 理由: {e}")
+        return []
+    except Exception as e:
+        print(f"予期せぬエラー（フィード取得中）: {url}, 理由: {e}")
+        return []
+
+def _html_parser(charset):
+    """Content-Typeヘッダーの文字コードで解析するHTMLパーサーを返す
+
+    ヘッダーに文字コードがない（または未知の）場合はNoneを返し、lxmlに<meta charset>から判定させる。
+    """
+    if not charset:
+        return None
+    try:
+        codecs.lookup(charset)
+    except LookupError:
+        return None
+    return lxml.html.HTMLParser(encoding=charset)
+
+def get_article_text(url):
+    """URLから記事の本文を抽出する（取得済みの記事はキャッシュから返す）"""
+    key = cache_key("article", url)
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        # 本文は先頭部分にあるので、ストリーミングで読み込みサイズに上限を設ける
+        content = bytearray()
+        with http_get_stream(url) as response:
+            charset = response.charset_encoding
+            for chunk in response.iter_bytes():
+                content += chunk
+                if len(content) >= MAX_ARTICLE_BYTES:
+                    break
+        # 空（空白のみを含む）の本文はlxmlがParserErrorにするため、解析せずに空文字を返す
+        if not content.strip():
+            return ""
+        tree = lxml.html.document_fromstring(bytes(content[:MAX_ARTICLE_BYTES]), parser=_html_parser(charset))
+
         # 主要なコンテンツが含まれていそうなタグを優先的に探す
-        main_content = soup.find("article") or soup.find("main") or soup.find("body")
-        
-        if main_content:
+        main_content = (tree.xpath("//article") or tree.xpath("//main") or tree.xpath("//body") or [None])[0]
+
+        if main_content is not None:
             # 不要な要素（ヘッダー、フッター、ナビゲーション、広告など）を削除
-            for tag in main_content.find_all(['script', 'style', 'nav', 'header', 'footer', 'aside', 'form']):
-                tag.decompose()
-            
-            paragraphs = main_content.find_all("p")
-            text = " ".join([p.get_text() for p in paragraphs])
-            return text.strip()
+            for tag in main_content.xpath(".//script | .//style | .//nav | .//header | .//footer | .//aside | .//form"):
+                tag.drop_tree()
+
+            paragraphs = main_content.xpath(".//p")
+            text = " ".join([p.text_content() for p in paragraphs]).strip()
+            if text:
+                cache_set(key, text)
+            return text
         return ""
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"記事取得エラー: {url}, 理由: {e}")
         return ""
     except Exception as e:
         print(f"予期せぬエラー（記事取得中）: {url}, 理由: {e}")
         return ""
 
-def summarize_text_with_gemini(text):
-    """Gemini APIを使ってテキストを要約する（リトライとレート制限対応付き）"""
-    if not text:
-        return "記事の本文を取得できませんでした。"
+def count_tokens(text):
+    """記事本文のトークン数を返す（キャッシュして再計算しない）。取得できなければNoneを返す"""
+    key = cache_key("tokens", text)
+    total_tokens = cache_get(key)
+    if total_tokens is None:
+        try:
+            total_tokens = TOKEN_COUNT_MODEL.count_tokens(text).total_tokens
+        except Exception as e:
+            print(f"トークン数の取得エラー: {e}")
+            return None
+        cache_set(key, total_tokens)
+    return total_tokens
+
+def fetch_article(url):
+    """記事の本文を取得し、トークン数も数える（スレッドプールのワーカーで実行する）
 
-    genai.configure(api_key=GEMINI_API_KEY)
-    model = genai.GenerativeModel('gemini-2.5-flash') # 無料利用枠でより多くのリクエストを処理できる可能性があるモデルに変更
-    prompt = f"以下のニュース記事を日本語で{MAX_SUMMARY_LENGTH}字程度の箇条書きで要約してください。重要なポイントを3つに絞ってください。\n\n---\n{text[:8000]}"
+    (本文, トークン数) を返す。
+    """
+    text = get_article_text(url)
+    return text, count_tokens(text) if text else None
+
+def truncate_to_tokens(text, total_tokens, max_tokens=MAX_ARTICLE_TOKENS):
+    """記事を文字数ではなくトークン数で切り詰める"""
+    if total_tokens is None:
+        # トークン数が分からない場合は従来どおり文字数で切り詰める
+        return text[:8000]
+    if total_tokens <= max_tokens:
+        return text
+    # 文字数とトークン数が比例するとみなして縮め、誤差の分だけ少し余裕を持たせる
+    return text[:int(len(text) * max_tokens / total_tokens * 0.95)]
+
+def summarize_texts_with_gemini(texts, token_counts=None):
+    """Gemini APIを使って複数の記事をまとめて要約する（リトライとレート制限対応付き）
+
+    texts と同じ順番・同じ数の要約リストを返す。token_counts には fetch_article で
+    数えた各記事のトークン数を渡す（省略した場合はここで数える）。
+    """
+    summaries = ["記事の本文を取得できませんでした。"] * len(texts)
+    # 本文を取得でき、まだ要約がキャッシュされていない記事だけをGeminiに送る
+    targets = []
+    for i, text in enumerate(texts):
+        if not text:
+            continue
+        cached = cache_get(cache_key("summary", text))
+        if cached is not None:
+            summaries[i] = cached
+        else:
+            targets.append(i)
+    if not targets:
+        return summaries
+
+    if token_counts is None:
+        token_counts = [count_tokens(text) if text else None for text in texts]
+    prompt = ARTICLE_DELIMITER.join(
+        f"[{n}] {truncate_to_tokens(texts[i], token_counts[i])}" for n, i in enumerate(targets)
+    )
 
     retries = 3
     backoff_factor = 5  # 秒
+    failure = "要約の生成に失敗しました（リトライ上限超過）。"
 
     for i in range(retries):
         try:
-            response = model.generate_content(
+            GEMINI_RATE_LIMITER.wait()
+            response = MODEL.generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.7, # 創造性を少し持たせる
+                    response_mime_type="application/json",
+                    response_schema=list[str],
                 ),
                 safety_settings=[
                     {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
@@ -82,7 +376,13 @@ def summarize_text_with_gemini(text):
             )
             # response.text の前に response.parts が存在するか確認
             if response.parts:
-                return response.text
+                results = json.loads(response.text)
+                if not isinstance(results, list) or len(results) != len(targets):
+                    raise ValueError(f"要約の数が記事の数と一致しません（記事: {len(targets)}件）")
+                for index, summary in zip(targets, results):
+                    summaries[index] = str(summary)
+                    cache_set(cache_key("summary", texts[index]), summaries[index])
+                return summaries
             else:
                 # レスポンスが空の場合のハンドリング
                 try:
@@ -95,29 +395,19 @@ def summarize_text_with_gemini(text):
                     time.sleep(backoff_factor * (2 ** i))
                     continue
                 else:
-                    return f"要約の生成に失敗しました: {error_message}"
+                    failure = f"要約の生成に失敗しました: {error_message}"
+                    break
 
         except Exception as e:
             error_message = f"Gemini APIエラー: {e}"
             print(error_message)
             # 429 (ResourceExhausted) エラーの場合、待機時間を長くする
             if "429" in str(e):
-                 # エラーメッセージからretry_delayを抽出する試み
-                try:
-                    match = re.search(r"retry_delay {\s*seconds: (\d+)\s*}", str(e))
-                    if match:
-                        wait_time = int(match.group(1)) + 1 # 1秒追加
-                        print(f"レート制限超過。{wait_time}秒待機します...")
-                        time.sleep(wait_time)
-                    else:
-                        # 固定時間待機
-                        wait_time = 60
-                        print(f"レート制限超過。{wait_time}秒待機します...")
-                        time.sleep(wait_time)
-                except Exception:
-                    wait_time = 60
-                    print(f"レート制限超過。{wait_time}秒待機します...")
-                    time.sleep(wait_time)
+                # エラーメッセージからretry_delayを抽出し、次のリクエストまでの待機をレートリミッターに任せる
+                match = _RETRY_RE.search(str(e))
+                wait_time = int(match.group(1)) + 1 if match else 60 # 1秒追加、抽出できなければ固定時間
+                print(f"レート制限超過。{wait_time}秒後に再試行します...")
+                GEMINI_RATE_LIMITER.defer(wait_time)
 
             # その他のエラーの場合は通常のバックオフ
             elif i < retries - 1:
@@ -125,25 +415,30 @@ def summarize_text_with_gemini(text):
                 print(f"エラーのため{wait_time}秒待機して再試行します...")
                 time.sleep(wait_time)
             else:
-                return f"要約の生成に失敗しました: {error_message}"
+                failure = f"要約の生成に失敗しました: {error_message}"
+                break
 
-    return "要約の生成に失敗しました（リトライ上限超過）。"
+    for index in targets:
+        summaries[index] = failure
+    return summaries
 
 
 def build_html_content(summaries):
     """要約リストからHTMLメールの本文を作成する"""
     today = datetime.now().strftime('%Y年%m月%d日')
-    html = f"<html><body><h1>{today}のニュースサマリー</h1>"
-    
+    # 文字列の連結を繰り返さず、部品をリストに集めて最後に一度だけ結合する
+    parts = [f"<html><body><h1>{today}のニュースサマリー</h1>"]
+
     for item in summaries:
-        html += f"<h2><a href='{item['link']}'>{item['title']}</a></h2>"
-        html += f"<h4>{item['source']}</h4>"
-        summary_with_br = item['summary'].replace('\n', '<br>')
-        html += f"<p>{summary_with_br}</p>"
-        html += "<hr>"
-        
-    html += "</body></html>"
-    return html
+        # タイトルや要約に & や < が含まれてもマークアップが崩れないようにエスケープする
+        summary_with_br = escape(item['summary']).replace('\n', '<br>')
+        parts.append(f"<h2><a href='{escape(item['link'])}'>{escape(item['title'])}</a></h2>")
+        parts.append(f"<h4>{escape(item['source'])}</h4>")
+        parts.append(f"<p>{summary_with_br}</p>")
+        parts.append("<hr>")
+
+    parts.append("</body></html>")
+    return "".join(parts)
 
 def send_email(html_content):
     """SendGridを使ってHTMLメールを送信する"""
@@ -172,27 +467,52 @@ def main():
         return
 
     all_summaries = []
-    for name, url in FEEDS.items():
-        print(f"--- {name}から記事を取得中 ---")
-        feed = feedparser.parse(url)
-        
-        for entry in feed.entries[:MAX_ENTRIES_PER_FEED]:
-            print(f"処理中の記事: {entry.title}")
-            
-            article_text = get_article_text(entry.link)
-            
-            summary = summarize_text_with_gemini(article_text)
-            
-            all_summaries.append({
-                "source": name,
-                "title": entry.title,
-                "link": entry.link,
-                "summary": summary
-            })
-            # 1分あたりのリクエスト数を考慮し、各記事の処理後に十分な待機時間を設ける
-            print("次の記事の処理まで31秒待機します...")
-            time.sleep(31)
+    # 途中で例外が発生しても、書き込んだキャッシュを失わないように必ず閉じる（HTTPクライアントも合わせて閉じる）
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # フィードと記事本文の取得はI/O待ちが中心なので並列に行う
+            print("--- フィードを取得中 ---")
+            feeds = list(executor.map(get_feed_entries, FEEDS.values()))
+
+            entries = []
+            for name, feed_entries in zip(FEEDS.keys(), feeds):
+                for title, link in feed_entries:
+                    entries.append((name, title, link))
+
+            # 本文の取得とトークン数の計算はバックグラウンドで進め、取得できた記事から順に要約する
+            print(f"--- {len(entries)}件の記事本文を取得中 ---")
+            article_futures = [executor.submit(fetch_article, link) for _, _, link in entries]
+
+            # Gemini APIはレート制限があるため、複数の記事を1回のリクエストにまとめて順番に要約する
+            seen_summaries = {}
+            for start in range(0, len(entries), SUMMARY_BATCH_SIZE):
+                # 1分あたりのリクエスト数はGEMINI_RATE_LIMITERが必要な分だけ待機して守る
+                batch = entries[start:start + SUMMARY_BATCH_SIZE]
+                for _, title, _ in batch:
+                    print(f"処理中の記事: {title}")
+                articles = [future.result() for future in article_futures[start:start + SUMMARY_BATCH_SIZE]]
+
+                # ミラーや共有リンクなどで本文が同じ記事は、この実行中に一度だけ要約する
+                digests = [body_digest(text) for text, _ in articles]
+                new_articles = {}
+                for digest, article in zip(digests, articles):
+                    if digest not in seen_summaries:
+                        new_articles.setdefault(digest, article)
+                if new_articles:
+                    texts, token_counts = zip(*new_articles.values())
+                    seen_summaries.update(zip(new_articles, summarize_texts_with_gemini(list(texts), list(token_counts))))
+                summaries = [seen_summaries[digest] for digest in digests]
 
+                for (name, title, link), summary in zip(batch, summaries):
+                    all_summaries.append({
+                        "source": name,
+                        "title": title,
+                        "link": link,
+                        "summary": summary
+                    })
+    finally:
+        close_cache()
+        HTTP_CLIENT.close()
 
     if all_summaries:
         print("HTMLメールを作成中...")